@@ -3,22 +3,42 @@
 
 import argparse
 import logging
+import os
+import platform
+import shutil
 import signal
 import subprocess
 import sys
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from src.config import Config
-from src.display.waveshare import WaveshareDisplay
-from src.handlers.image_handler import ImageHandler
-from src.handlers.system_handler import SystemHandler
-from src.mqtt.client import MQTTClient
-from src.pisugar.client import PisugarClient
 from src.state import AppState
 
+# Heavy imports (PIL, numpy, paho, hardware drivers) are deferred to the
+# setup_* methods that need them to keep cold-start fast on battery wakes
+if TYPE_CHECKING:
+    from src.display.base import DisplayBase
+    from src.handlers.base import HandlerBase
+    from src.mqtt.client import MQTTClient
+
 logger = logging.getLogger(__name__)
 
+# Resolve the shutdown binary once at import so the power-off fallback uses an
+# absolute path instead of walking PATH (sbin dirs) at shutdown time
+_SHUTDOWN = shutil.which("shutdown") or "/sbin/shutdown"
+
+
+@dataclass
+class Services:
+    """Runtime service instances wired up during startup."""
+
+    display: "DisplayBase | None" = None
+    mqtt: "MQTTClient | None" = None
+    handlers: "list[HandlerBase]" = field(default_factory=list)
+
 
 class WavesharePictureFrame:
     """Main application class."""
@@ -34,9 +54,7 @@ class WavesharePictureFrame:
         self.config = config
         self.dry_run = dry_run
         self.battery_mode = battery_mode
-        self.display = None
-        self.mqtt_client = None
-        self.handlers = []
+        self.services = Services()
         self._shutting_down = False
         self.app_state = AppState()
 
@@ -50,20 +68,27 @@ class WavesharePictureFrame:
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         if self._shutting_down:
+            # os._exit skips interpreter teardown: sys.exit would block
+            # joining the non-daemon handler worker, so a wedged handler
+            # (e.g. a ~30 s e-ink refresh) would stall the forced exit
             logger.warning("Forced shutdown!")
-            sys.exit(1)
+            os._exit(1)
 
-        logger.info(f"Received signal {signum}, shutting down...")
+        logger.info("Received signal %s, shutting down...", signum)
         self._shutting_down = True
         self.shutdown()
         sys.exit(0)
 
     def setup_logging(self):
         """Configure logging based on config."""
-        logging.basicConfig(
-            level=getattr(logging, self.config.logging.level),
-            format=self.config.logging.format,
-        )
+        level = logging.getLevelNamesMapping().get(self.config.logging.level, logging.INFO)
+
+        # Only install handlers once; re-runs (e.g. mode switches) just adjust the level
+        root = logging.getLogger()
+        if root.handlers:
+            root.setLevel(level)
+        else:
+            logging.basicConfig(level=level, format=self.config.logging.format)
         logger.info("Logging configured")
 
     def setup_display(self):
@@ -73,26 +98,36 @@ class WavesharePictureFrame:
         if self.dry_run:
             from src.display.mock import MockDisplay
 
-            self.display = MockDisplay(
+            self.services.display = MockDisplay(
                 model=self.config.display.model,
                 width=self.config.display.width,
                 height=self.config.display.height,
             )
         else:
-            self.display = WaveshareDisplay(
+            from src.display.waveshare import WaveshareDisplay
+
+            self.services.display = WaveshareDisplay(
                 model=self.config.display.model,
                 width=self.config.display.width,
                 height=self.config.display.height,
+                dither=self.config.display.dither,
             )
 
-        self.display.init()
+        self.services.display.init()
+
+        # SIMD builds of Pillow (pillow-simd) show up as a .postN version
+        import PIL
+
+        logger.debug("Pillow version: %s", PIL.__version__)
         logger.info("Display setup complete")
 
     def setup_mqtt(self):
         """Initialize MQTT client (but don't connect yet)."""
         logger.info("Setting up MQTT client")
 
-        self.mqtt_client = MQTTClient(
+        from src.mqtt.client import MQTTClient
+
+        self.services.mqtt = MQTTClient(
             broker_host=self.config.mqtt.host,
             broker_port=self.config.mqtt.port,
             client_id=self.config.mqtt.client_id,
@@ -103,7 +138,7 @@ class WavesharePictureFrame:
 
         # Add topics
         for topic in self.config.mqtt.topics:
-            self.mqtt_client.add_topic(topic)
+            self.services.mqtt.add_topic(topic)
 
         logger.info("MQTT client initialized")
 
@@ -111,35 +146,34 @@ class WavesharePictureFrame:
         """Initialize message handlers and register them with MQTT client."""
         logger.info("Setting up handlers")
 
-        assert self.display is not None, "Display must be initialized before setting up handlers"
-        assert self.mqtt_client is not None, (
-            "MQTT client must be initialized before setting up handlers"
-        )
+        from src.handlers.system_handler import SystemHandler
 
-        # Add system handler (for mode control)
+        # Add system handler (for mode control) - stays eager so mode
+        # commands work without any deferred construction
         system_handler = SystemHandler(self.app_state)
-        self.handlers.append(system_handler)
-
-        # Add image handler with preview support
-        image_handler = ImageHandler(
-            display=self.display,
-            mqtt_client=self.mqtt_client,
-            preview_config=self.config.preview,
-            image_processing_config=self.config.image_processing,
-        )
-        self.handlers.append(image_handler)
+        self.services.handlers.append(system_handler)
+        self.services.mqtt.register_handler(system_handler)
+
+        # Image handler is built on its first display_image message, so wakes
+        # without messages never pay for its imports (PIL, requests, numpy)
+        def image_handler_factory():
+            from src.handlers.image_handler import ImageHandler
+
+            return ImageHandler(
+                display=self.services.display,
+                mqtt_client=self.services.mqtt,
+                preview_config=self.config.preview,
+                image_processing_config=self.config.image_processing,
+            )
 
-        # Register handlers with MQTT client
-        for handler in self.handlers:
-            self.mqtt_client.register_handler(handler)
+        self.services.mqtt.register_handler_factory(["display_image"], image_handler_factory)
 
-        logger.info(f"Initialized {len(self.handlers)} handler(s)")
+        logger.info("Initialized %d handler(s)", len(self.services.mqtt.handlers))
 
     def connect_mqtt(self):
         """Connect to MQTT broker."""
-        assert self.mqtt_client is not None, "MQTT client must be initialized"
         logger.info("Connecting to MQTT broker")
-        self.mqtt_client.connect()
+        self.services.mqtt.connect()
         logger.info("MQTT connected")
 
     def _get_device_info(self) -> tuple[str, str, dict]:
@@ -176,8 +210,6 @@ class WavesharePictureFrame:
             self.setup_handlers()
             self.connect_mqtt()
 
-            assert self.mqtt_client is not None, "MQTT client must be initialized"
-
             # Publish Home Assistant MQTT discovery messages (if preview enabled)
             if self.config.preview.enabled:
                 try:
@@ -186,12 +218,11 @@ class WavesharePictureFrame:
                     preview_discovery = {
                         "name": f"{device_name} Preview",
                         "image_topic": self.config.preview.topic,
-                        "image_encoding": "b64",
                         "content_type": "image/jpeg",
                         "unique_id": f"{device_id}_preview",
                         "device": device_info,
                     }
-                    self.mqtt_client.publish(
+                    self.services.mqtt.publish(
                         topic=f"homeassistant/image/{device_id}_preview/config",
                         payload=preview_discovery,
                         qos=1,
@@ -200,39 +231,44 @@ class WavesharePictureFrame:
                     logger.info("Published Home Assistant preview discovery message")
 
                 except Exception as e:
-                    logger.warning(f"Failed to publish HA discovery message: {e}")
+                    logger.warning("Failed to publish HA discovery message: %s", e)
 
             # Run MQTT client (blocking)
-            self.mqtt_client.run_forever()
+            self.services.mqtt.run_forever()
 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         except Exception as e:
-            logger.error(f"Application error: {e}", exc_info=True)
+            logger.error("Application error: %s", e, exc_info=True)
         finally:
             self.shutdown()
 
     def run_battery_mode(self):
         """Run in battery-powered mode with Pisugar RTC wake-up."""
+        from src.pisugar.client import PisugarClient
+
         # Track battery mode status for reporting to Home Assistant
         status = "ok"  # Possible values: "ok", "rtc_failure", "image_fetch_failed"
+        pisugar = None
 
         try:
             logger.info("Starting Waveshare Picture Frame (battery mode)")
 
+            # One Pisugar client is reused for the whole wake cycle (time sync,
+            # alarm flag, battery reads, RTC alarm) instead of reconnecting
+            if self.config.pisugar.use_tcp:
+                pisugar = PisugarClient(
+                    host=self.config.pisugar.tcp_host,
+                    port=self.config.pisugar.tcp_port,
+                )
+            else:
+                pisugar = PisugarClient(socket_path=self.config.pisugar.socket_path)
+
             # Sync system time from Pisugar RTC before anything else
             try:
-                if self.config.pisugar.use_tcp:
-                    pisugar = PisugarClient(
-                        host=self.config.pisugar.tcp_host,
-                        port=self.config.pisugar.tcp_port,
-                    )
-                else:
-                    pisugar = PisugarClient(socket_path=self.config.pisugar.socket_path)
-
                 pisugar.sync_time_from_rtc()
             except Exception as e:
-                logger.warning(f"Failed to sync time from RTC: {e}")
+                logger.warning("Failed to sync time from RTC: %s", e)
 
             # Setup components
             self.setup_display()
@@ -240,8 +276,6 @@ class WavesharePictureFrame:
             self.setup_handlers()
             self.connect_mqtt()
 
-            assert self.mqtt_client is not None, "MQTT client must be initialized"
-
             # Publish Home Assistant MQTT discovery messages
             try:
                 device_name, device_id, device_info = self._get_device_info()
@@ -257,7 +291,7 @@ class WavesharePictureFrame:
                     "unique_id": f"{device_id}_battery",
                     "device": device_info,
                 }
-                self.mqtt_client.publish(
+                self.services.mqtt.publish(
                     topic=f"homeassistant/sensor/{device_id}_battery/config",
                     payload=battery_discovery,
                     qos=1,
@@ -270,12 +304,11 @@ class WavesharePictureFrame:
                     preview_discovery = {
                         "name": f"{device_name} Preview",
                         "image_topic": self.config.preview.topic,
-                        "image_encoding": "b64",
                         "content_type": "image/jpeg",
                         "unique_id": f"{device_id}_preview",
                         "device": device_info,
                     }
-                    self.mqtt_client.publish(
+                    self.services.mqtt.publish(
                         topic=f"homeassistant/image/{device_id}_preview/config",
                         payload=preview_discovery,
                         qos=1,
@@ -293,7 +326,7 @@ class WavesharePictureFrame:
                     "unique_id": f"{device_id}_status",
                     "device": device_info,
                 }
-                self.mqtt_client.publish(
+                self.services.mqtt.publish(
                     topic=f"homeassistant/sensor/{device_id}_status/config",
                     payload=status_discovery,
                     qos=1,
@@ -302,34 +335,17 @@ class WavesharePictureFrame:
                 logger.debug("Published status sensor discovery message")
 
             except Exception as e:
-                logger.warning(f"Failed to publish HA discovery messages: {e}")
+                logger.warning("Failed to publish HA discovery messages: %s", e)
 
             # Clear RTC alarm flag from previous wake-up (critical for subsequent alarms to work)
             try:
-                if self.config.pisugar.use_tcp:
-                    pisugar = PisugarClient(
-                        host=self.config.pisugar.tcp_host,
-                        port=self.config.pisugar.tcp_port,
-                    )
-                else:
-                    pisugar = PisugarClient(socket_path=self.config.pisugar.socket_path)
-
                 pisugar.clear_rtc_alarm_flag()
                 logger.info("RTC alarm flag cleared - subsequent alarms will work")
             except Exception as e:
-                logger.warning(f"Failed to clear RTC alarm flag: {e}")
+                logger.warning("Failed to clear RTC alarm flag: %s", e)
 
             # Publish battery status to MQTT
             try:
-                # Create Pisugar client to read battery level
-                if self.config.pisugar.use_tcp:
-                    pisugar = PisugarClient(
-                        host=self.config.pisugar.tcp_host,
-                        port=self.config.pisugar.tcp_port,
-                    )
-                else:
-                    pisugar = PisugarClient(socket_path=self.config.pisugar.socket_path)
-
                 battery_level = pisugar.get_battery_level()
                 if battery_level is not None:
                     # Publish battery status
@@ -337,26 +353,26 @@ class WavesharePictureFrame:
                         "battery_level": battery_level,
                         "timestamp": datetime.now().isoformat(),
                     }
-                    self.mqtt_client.publish(
+                    self.services.mqtt.publish(
                         topic=self.config.pisugar.battery_topic,
                         payload=battery_payload,
                         qos=1,
                     )
-                    logger.info(f"Published battery level: {battery_level:.1f}%")
+                    logger.info("Published battery level: %.1f%%", battery_level)
                 else:
                     logger.warning("Could not read battery level from Pisugar")
             except Exception as e:
-                logger.error(f"Failed to publish battery status: {e}")
+                logger.error("Failed to publish battery status: %s", e)
 
             # Check for messages with timeout
             timeout = self.config.pisugar.message_wait_timeout
             try:
-                messages_processed = self.mqtt_client.run_once(timeout=timeout)
-                logger.info(f"Battery mode: processed {messages_processed} message(s)")
+                messages_processed = self.services.mqtt.run_once(timeout=timeout)
+                logger.info("Battery mode: processed %d message(s)", messages_processed)
             except Exception as e:
                 # Image fetch or other handler failures are logged but don't prevent shutdown
                 # as long as RTC alarm can be set
-                logger.error(f"Error processing messages: {e}")
+                logger.error("Error processing messages: %s", e)
                 status = "image_fetch_failed"
 
             # Check if continuous mode was enabled via MQTT command
@@ -365,28 +381,20 @@ class WavesharePictureFrame:
                     "Continuous mode enabled - switching to always-on mode. "
                     "Device will not shutdown automatically."
                 )
-                # Reconnect MQTT and run forever
-                self.mqtt_client.connect()
-                self.mqtt_client.run_forever()
+                # Run forever, reconnecting only if run_once tore the link down
+                if not self.services.mqtt.is_connected():
+                    self.services.mqtt.connect()
+                self.services.mqtt.run_forever()
                 return  # Skip RTC alarm and shutdown
 
             # Setup Pisugar RTC alarm for next wake-up
             rtc_alarm_verified = False
             if self.config.pisugar.shutdown_after_display:
                 try:
-                    # Create Pisugar client (TCP or Unix socket based on config)
-                    if self.config.pisugar.use_tcp:
-                        pisugar = PisugarClient(
-                            host=self.config.pisugar.tcp_host,
-                            port=self.config.pisugar.tcp_port,
-                        )
-                    else:
-                        pisugar = PisugarClient(socket_path=self.config.pisugar.socket_path)
-
                     # Get battery level for logging
                     battery_level = pisugar.get_battery_level()
                     if battery_level is not None:
-                        logger.info(f"Battery level: {battery_level:.1f}%")
+                        logger.info("Battery level: %.1f%%", battery_level)
 
                     # Calculate next wake time
                     wake_interval = timedelta(minutes=self.config.pisugar.wake_interval_minutes)
@@ -402,50 +410,38 @@ class WavesharePictureFrame:
                     # Verify alarm was set
                     if pisugar.is_rtc_alarm_enabled():
                         alarm_time = pisugar.get_rtc_alarm_time()
-                        logger.info(f"RTC alarm confirmed: {alarm_time}")
+                        logger.info("RTC alarm confirmed: %s", alarm_time)
                         rtc_alarm_verified = True
                     else:
                         logger.error("RTC alarm verification failed - alarm not enabled")
                         status = "rtc_failure"
 
                 except Exception as e:
-                    logger.error(f"Failed to set RTC alarm: {e}", exc_info=True)
+                    logger.error("Failed to set RTC alarm: %s", e, exc_info=True)
                     status = "rtc_failure"
 
                 # Publish status to Home Assistant (reconnect first since run_once disconnected)
                 try:
-                    self.mqtt_client.connect()
+                    self.services.mqtt.connect()
                     status_payload = {
                         "status": status,
                         "timestamp": datetime.now().isoformat(),
                     }
-                    self.mqtt_client.publish(
+                    self.services.mqtt.publish(
                         topic=self.config.pisugar.status_topic,
                         payload=status_payload,
                         qos=1,
                         retain=True,
                     )
-                    logger.info(f"Published system status: {status}")
-                    self.mqtt_client.disconnect()
+                    logger.info("Published system status: %s", status)
+                    self.services.mqtt.disconnect()
                 except Exception as e:
-                    logger.error(f"Failed to publish status: {e}")
+                    logger.error("Failed to publish status: %s", e)
 
                 # Only shutdown if RTC alarm was successfully verified
                 if rtc_alarm_verified:
                     logger.info("RTC alarm verified - proceeding with system shutdown")
-                    try:
-                        # Use subprocess to run shutdown command
-                        # Note: Requires passwordless sudo for shutdown command
-                        subprocess.run(["sudo", "shutdown", "-h", "now"], check=True)
-                    except subprocess.CalledProcessError as e:
-                        logger.error(f"Failed to shutdown system: {e}")
-                        logger.error(
-                            "Make sure the user has passwordless sudo for shutdown. "
-                            "Add to /etc/sudoers.d/waveshare-frame:\n"
-                            "waveshare ALL=(ALL) NOPASSWD: /sbin/shutdown"
-                        )
-                    except FileNotFoundError:
-                        logger.error("shutdown command not found")
+                    self._power_off()
                 else:
                     logger.error(
                         "RTC alarm NOT verified - aborting shutdown to prevent device from "
@@ -456,27 +452,63 @@ class WavesharePictureFrame:
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         except Exception as e:
-            logger.error(f"Battery mode error: {e}", exc_info=True)
+            logger.error("Battery mode error: %s", e, exc_info=True)
         finally:
+            if pisugar is not None:
+                pisugar.close()
             self.shutdown()
 
+    def _power_off(self):
+        """Power off the system.
+
+        Prefers a direct logind D-Bus call (no sudo fork, no PAM; requires a
+        polkit rule granting org.freedesktop.login1.power-off). Falls back to
+        `sudo shutdown -h now`, which requires passwordless sudo for shutdown.
+        """
+        try:
+            import pydbus
+
+            bus = pydbus.SystemBus()
+            logind = bus.get(".login1")
+            logind.PowerOff(False)
+            logger.info("Requested power-off via logind D-Bus")
+            return
+        except ImportError:
+            logger.debug("pydbus not available, falling back to shutdown command")
+        except Exception as e:
+            logger.warning("logind PowerOff failed (%s), falling back to shutdown command", e)
+
+        try:
+            # Note: Requires passwordless sudo for shutdown command
+            subprocess.run(["sudo", _SHUTDOWN, "-h", "now"], check=True)
+        except subprocess.CalledProcessError as e:
+            logger.error("Failed to shutdown system: %s", e)
+            logger.error(
+                "Make sure the user has passwordless sudo for shutdown. "
+                "Add to /etc/sudoers.d/waveshare-frame:\n"
+                "waveshare ALL=(ALL) NOPASSWD: /sbin/shutdown"
+            )
+        except FileNotFoundError:
+            logger.error("shutdown command not found")
+
     def shutdown(self):
         """Gracefully shutdown the application."""
         logger.info("Shutting down application")
+        svc = self.services
 
         # Disconnect MQTT
-        if self.mqtt_client:
+        if svc.mqtt:
             try:
-                self.mqtt_client.disconnect()
+                svc.mqtt.disconnect()
             except Exception as e:
-                logger.error(f"Error disconnecting MQTT: {e}")
+                logger.error("Error disconnecting MQTT: %s", e)
 
         # Sleep display
-        if self.display and self.display.is_initialized:
+        if svc.display and svc.display.is_initialized:
             try:
-                self.display.sleep()
+                svc.display.sleep()
             except Exception as e:
-                logger.error(f"Error shutting down display: {e}")
+                logger.error("Error shutting down display: %s", e)
 
         logger.info("Shutdown complete")
 
@@ -529,10 +561,13 @@ def main():
         logger.info("Running display test")
 
         try:
+            from src.display.waveshare import WaveshareDisplay
+
             display = WaveshareDisplay(
                 model=config.display.model,
                 width=config.display.width,
                 height=config.display.height,
+                dither=config.display.dither,
             )
             display.init()
 
@@ -553,12 +588,21 @@ def main():
             display.display_image(image)
             logger.info("Test image displayed. Press Ctrl+C to exit")
 
-            input()  # Wait for user input
+            # Wait for Ctrl+C; signal.pause drops straight into the signal
+            # handler without the readline machinery (not available on Windows)
+            try:
+                if platform.system() == "Windows":
+                    input()
+                else:
+                    signal.pause()
+            except KeyboardInterrupt:
+                pass
+
             display.clear()
             display.sleep()
 
         except Exception as e:
-            logger.error(f"Display test failed: {e}")
+            logger.error("Display test failed: %s", e)
             sys.exit(1)
 
         logger.info("Display test complete")
@@ -1,18 +1,82 @@
 """Configuration management for the application."""
 
 import logging
+import os
+import pickle
 import tomllib
-from dataclasses import dataclass, field
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, BinaryIO
+
+# rtoml is a native-code TOML parser, several times faster than the stdlib
+# tomllib on cold boot; fall back to tomllib when it isn't installed
+try:
+    import rtoml
+
+    def _load_toml(f: BinaryIO) -> dict[str, Any]:
+        """Parse TOML from a binary file object."""
+        return rtoml.loads(f.read().decode("utf-8"))
+
+    _TomlError: type[Exception] = rtoml.TomlParsingError
+except ImportError:
+
+    def _load_toml(f: BinaryIO) -> dict[str, Any]:
+        """Parse TOML from a binary file object."""
+        return tomllib.load(f)
+
+    _TomlError = tomllib.TOMLDecodeError
 
 logger = logging.getLogger(__name__)
 
 
+_TRUE = frozenset({"true", "1", "yes", "on"})
+
+
+def _cast_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() in _TRUE
+
+
+# Environment variable overrides, dispatched in a single pass over os.environ:
+# env var name -> (config section, key, cast function)
+_ENV_OVERRIDES: dict[str, tuple[str, str, Callable[[str], Any]]] = {
+    "WAVESHARE_MQTT_HOST": ("mqtt", "host", str),
+    "WAVESHARE_MQTT_PORT": ("mqtt", "port", int),
+    "WAVESHARE_MQTT_CLIENT_ID": ("mqtt", "client_id", str),
+    "WAVESHARE_MQTT_USERNAME": ("mqtt", "username", str),
+    "WAVESHARE_MQTT_PASSWORD": ("mqtt", "password", str),
+    "WAVESHARE_DISPLAY_MODEL": ("display", "model", str),
+    "WAVESHARE_DISPLAY_WIDTH": ("display", "width", int),
+    "WAVESHARE_DISPLAY_HEIGHT": ("display", "height", int),
+    "WAVESHARE_DISPLAY_DITHER": ("display", "dither", _cast_bool),
+    "WAVESHARE_LOGGING_LEVEL": ("logging", "level", str),
+    "WAVESHARE_PISUGAR_ENABLED": ("pisugar", "enabled", _cast_bool),
+    "WAVESHARE_PISUGAR_WAKE_INTERVAL_MINUTES": ("pisugar", "wake_interval_minutes", int),
+    "WAVESHARE_PISUGAR_USE_TCP": ("pisugar", "use_tcp", _cast_bool),
+    "WAVESHARE_PISUGAR_TCP_HOST": ("pisugar", "tcp_host", str),
+    "WAVESHARE_PISUGAR_TCP_PORT": ("pisugar", "tcp_port", int),
+    "WAVESHARE_PISUGAR_SOCKET_PATH": ("pisugar", "socket_path", str),
+    "WAVESHARE_PISUGAR_BATTERY_TOPIC": ("pisugar", "battery_topic", str),
+    "WAVESHARE_PISUGAR_STATUS_TOPIC": ("pisugar", "status_topic", str),
+    "WAVESHARE_PREVIEW_ENABLED": ("preview", "enabled", _cast_bool),
+    "WAVESHARE_PREVIEW_TOPIC": ("preview", "topic", str),
+    "WAVESHARE_PREVIEW_WIDTH": ("preview", "width", int),
+    "WAVESHARE_PREVIEW_QUALITY": ("preview", "quality", int),
+    "WAVESHARE_PREVIEW_RESAMPLE": ("preview", "resample", str),
+}
+
+# Cache for the parsed config, keyed on the source file's mtime and size.
+# Battery mode restarts the whole process every wake cycle, so skipping the
+# TOML parse when the file hasn't changed shaves startup time on each wake.
+_CACHE_PATH = Path("~/.cache/waveshare-frame/config.pkl").expanduser()
+
+
 @dataclass
 class MQTTConfig:
     """MQTT broker configuration."""
 
-    host: str
+    host: str = "localhost"
     port: int = 1883
     client_id: str | None = None
     username: str | None = None
@@ -28,6 +92,7 @@ class DisplayConfig:
     model: str = "7in3e"
     width: int = 800
     height: int = 480
+    dither: bool = True  # Dither when quantizing; false = faster nearest-color conversion
 
 
 @dataclass
@@ -62,6 +127,7 @@ class PreviewConfig:
     topic: str = "home/displays/waveshare/preview"  # MQTT topic for preview image
     width: int = 320  # Thumbnail width in pixels
     quality: int = 80  # JPEG quality (1-100)
+    resample: str = "bilinear"  # Resampling filter: bilinear, bicubic, or lanczos
 
 
 @dataclass
@@ -86,79 +152,115 @@ class Config:
     def from_dict(cls, data: dict[str, Any]) -> "Config":
         """Create config from dictionary.
 
+        Each section dataclass is constructed from the keys it declares, so
+        defaults live solely on the dataclass definitions and unknown keys in
+        the file are ignored.
+
         Args:
             data: Configuration dictionary
 
         Returns:
             Config instance
         """
-        mqtt_data = data.get("mqtt", {})
-        display_data = data.get("display", {})
-        logging_data = data.get("logging", {})
-        pisugar_data = data.get("pisugar", {})
-        preview_data = data.get("preview", {})
-        image_processing_data = data.get("image_processing", {})
-
-        mqtt_config = MQTTConfig(
-            host=mqtt_data.get("host", "localhost"),
-            port=mqtt_data.get("port", 1883),
-            client_id=mqtt_data.get("client_id"),
-            username=mqtt_data.get("username"),
-            password=mqtt_data.get("password"),
-            topics=mqtt_data.get("topics", []),
-            shutdown_timeout=mqtt_data.get("shutdown_timeout", 60.0),
-        )
+        sections = {}
+        for section in fields(cls):
+            section_cls = section.type
+            section_data = data.get(section.name, {})
+            known = {f.name for f in fields(section_cls)}
+            sections[section.name] = section_cls(
+                **{k: v for k, v in section_data.items() if k in known}
+            )
+        return cls(**sections)
 
-        display_config = DisplayConfig(
-            model=display_data.get("model", "7in3e"),
-            width=display_data.get("width", 800),
-            height=display_data.get("height", 480),
-        )
+    @classmethod
+    def _override_with_env(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply WAVESHARE_* environment variable overrides to raw config data.
 
-        logging_config = LoggingConfig(
-            level=logging_data.get("level", "INFO"),
-            format=logging_data.get(
-                "format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            ),
-        )
+        Returns instantly when no WAVESHARE_* variables are set (the common case).
 
-        pisugar_config = PisugarConfig(
-            enabled=pisugar_data.get("enabled", False),
-            wake_interval_minutes=pisugar_data.get("wake_interval_minutes", 15),
-            use_tcp=pisugar_data.get("use_tcp", True),
-            tcp_host=pisugar_data.get("tcp_host", "127.0.0.1"),
-            tcp_port=pisugar_data.get("tcp_port", 8423),
-            socket_path=pisugar_data.get("socket_path", "/tmp/pisugar-server.sock"),
-            message_wait_timeout=pisugar_data.get("message_wait_timeout", 30),
-            shutdown_after_display=pisugar_data.get("shutdown_after_display", True),
-            battery_topic=pisugar_data.get("battery_topic", "home/displays/waveshare/battery"),
-            status_topic=pisugar_data.get("status_topic", "home/displays/waveshare/status"),
-        )
+        Args:
+            data: Configuration dictionary parsed from TOML
 
-        preview_config = PreviewConfig(
-            enabled=preview_data.get("enabled", True),
-            topic=preview_data.get("topic", "home/displays/waveshare/preview"),
-            width=preview_data.get("width", 320),
-            quality=preview_data.get("quality", 80),
-        )
+        Returns:
+            Configuration dictionary with overrides applied
+        """
+        env = os.environ
+        if not any(k.startswith("WAVESHARE_") for k in env):
+            return data
 
-        image_processing_config = ImageProcessingConfig(
-            auto_crop_borders=image_processing_data.get("auto_crop_borders", True),
-        )
+        for name, (section, key, cast) in _ENV_OVERRIDES.items():
+            value = env.get(name)
+            if value is not None:
+                data.setdefault(section, {})[key] = cast(value)
+                logger.debug(f"Overriding {section}.{key} from {name}")
+        return data
+
+    @classmethod
+    def _schema_token(cls) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """Field layout of the config dataclasses.
 
-        return cls(
-            mqtt=mqtt_config,
-            display=display_config,
-            logging=logging_config,
-            pisugar=pisugar_config,
-            preview=preview_config,
-            image_processing=image_processing_config,
+        Part of the cache key so a pickle written by an older build — whose
+        sections lack fields added since — is treated as stale instead of
+        resurfacing as AttributeErrors at first use.
+
+        Returns:
+            Tuple of (section name, section field names) pairs
+        """
+        return tuple(
+            (section.name, tuple(f.name for f in fields(section.type)))
+            for section in fields(cls)
         )
 
+    @classmethod
+    def _load_cached(cls, file_path: str, stat: os.stat_result) -> "Config | None":
+        """Return a cached Config if it matches the file's current mtime and size.
+
+        Args:
+            file_path: Path to configuration file
+            stat: Current stat result for the configuration file
+
+        Returns:
+            Cached Config instance, or None if the cache is missing or stale
+        """
+        try:
+            with open(_CACHE_PATH, "rb") as f:
+                cache_key, config = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, ValueError, AttributeError):
+            return None
+
+        if cache_key != (file_path, stat.st_mtime_ns, stat.st_size, cls._schema_token()):
+            return None
+        if not isinstance(config, cls):
+            return None
+        return config
+
+    @classmethod
+    def _store_cached(cls, file_path: str, stat: os.stat_result, config: "Config") -> None:
+        """Write the config cache atomically; failures are non-fatal.
+
+        Args:
+            file_path: Path to configuration file
+            stat: Stat result the cache entry should be keyed on
+            config: Parsed configuration to cache
+        """
+        try:
+            _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _CACHE_PATH.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                cache_key = (file_path, stat.st_mtime_ns, stat.st_size, cls._schema_token())
+                pickle.dump((cache_key, config), f)
+            os.replace(tmp_path, _CACHE_PATH)
+        except OSError as e:
+            logger.debug(f"Failed to write config cache: {e}")
+
     @classmethod
     def from_file(cls, file_path: str) -> "Config":
         """Load configuration from TOML file.
 
+        A pickled copy of the parsed config is cached under ~/.cache/waveshare-frame/
+        keyed on the file's mtime and size, so repeated loads (battery-mode wake
+        cycles) skip the TOML parse when the file is unchanged.
+
         Args:
             file_path: Path to configuration file
 
@@ -168,17 +270,31 @@ class Config:
         logger.info(f"Loading configuration from {file_path}")
 
         try:
+            stat = os.stat(file_path)
+
+            # Env overrides make the result dependent on more than the file,
+            # so the cache is only used when no override vars are set
+            has_env_overrides = any(k.startswith("WAVESHARE_") for k in os.environ)
+
+            if not has_env_overrides:
+                cached = cls._load_cached(file_path, stat)
+                if cached is not None:
+                    logger.info("Configuration loaded from cache")
+                    return cached
+
             with open(file_path, "rb") as f:
-                data = tomllib.load(f)
+                data = _load_toml(f)
 
-            config = cls.from_dict(data)
+            config = cls.from_dict(cls._override_with_env(data))
+            if not has_env_overrides:
+                cls._store_cached(file_path, stat, config)
             logger.info("Configuration loaded successfully")
             return config
 
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {file_path}")
             raise
-        except tomllib.TOMLDecodeError as e:
+        except _TomlError as e:
             logger.error(f"Invalid TOML in configuration file: {e}")
             raise
         except Exception as e:
@@ -0,0 +1,107 @@
+"""Nearest-palette quantization kernels for 7-color e-ink panels.
+
+Used by WaveshareDisplay when dithering is disabled: instead of Pillow's
+dithered quantize, each pixel is mapped straight to its closest palette
+color. The kernel is JIT-compiled with numba when it is installed (compiled
+eagerly at import via an explicit signature, so the cost is paid at startup
+rather than on the first frame) and falls back to a precomputed
+5-bit-per-channel lookup table otherwise. numba is not a hard dependency —
+it is heavy to install on a Pi Zero, and the NumPy path is fast enough there.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+# Nearest-index lookup tables keyed by palette contents, built once per palette.
+# 5 bits per channel -> 32768 entries (32 KiB), indexed by (r5 << 10 | g5 << 5 | b5).
+_LUT_CACHE: dict[bytes, np.ndarray] = {}
+
+
+def _palette_lut(palette: np.ndarray) -> np.ndarray:
+    """Build (and cache) the 5-bit-per-channel nearest-index LUT for a palette."""
+    key = palette.tobytes()
+    lut = _LUT_CACHE.get(key)
+    if lut is None:
+        # Each 5-bit cell is represented by its center value
+        levels = (np.arange(32, dtype=np.int32) << 3) + 4
+        grid = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1)
+        diff = grid.reshape(-1, 1, 3) - palette[None, :, :]
+        lut = (diff * diff).sum(axis=2).argmin(axis=1).astype(np.uint8)
+        _LUT_CACHE[key] = lut
+    return lut
+
+
+def _nearest_palette_lut(rgb: np.ndarray, palette: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Map each pixel to its nearest palette index via a precomputed LUT.
+
+    One gather per pixel instead of an exhaustive distance search; with only
+    7 widely spaced panel colors the 5-bit quantization of the key never
+    changes the winner except right on a color boundary.
+
+    Args:
+        rgb: (H, W, 3) uint8 image array
+        palette: (N, 3) int32 palette array
+        out: Preallocated (H, W) uint8 array to fill in place
+
+    Returns:
+        The filled out array of palette indices
+    """
+    lut = _palette_lut(palette)
+    r = rgb[..., 0].astype(np.uint16) >> 3
+    g = rgb[..., 1].astype(np.uint16) >> 3
+    b = rgb[..., 2] >> 3
+    np.take(lut, (r << 10) | (g << 5) | b, out=out)
+    return out
+
+
+if HAVE_NUMBA:
+
+    @njit(
+        "void(uint8[:,:,::1], int32[:,::1], uint8[:,::1])",
+        parallel=True,
+        cache=True,
+        fastmath=True,
+    )
+    def _nearest_palette_numba(rgb, palette, out):  # pragma: no cover - needs numba
+        height, width, _ = rgb.shape
+        for y in prange(height):
+            for x in range(width):
+                best = 0
+                best_dist = 1 << 30
+                for p in range(palette.shape[0]):
+                    dr = rgb[y, x, 0] - palette[p, 0]
+                    dg = rgb[y, x, 1] - palette[p, 1]
+                    db = rgb[y, x, 2] - palette[p, 2]
+                    dist = dr * dr + dg * dg + db * db
+                    if dist < best_dist:
+                        best_dist = dist
+                        best = p
+                out[y, x] = best
+
+
+def nearest_palette_indices(
+    rgb: np.ndarray, palette: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Map each pixel of an RGB array to its nearest palette index.
+
+    Args:
+        rgb: (H, W, 3) uint8 image array
+        palette: (N, 3) int32 palette array
+        out: Optional preallocated (H, W) uint8 array to fill in place
+
+    Returns:
+        (H, W) uint8 array of palette indices (out when provided)
+    """
+    if out is None:
+        out = np.empty(rgb.shape[:2], dtype=np.uint8)
+    if HAVE_NUMBA:
+        _nearest_palette_numba(np.ascontiguousarray(rgb), np.ascontiguousarray(palette), out)
+        return out
+    return _nearest_palette_lut(rgb, palette, out)
@@ -1,5 +1,7 @@
 """Base class for display implementations."""
 
+import functools
+import io
 from abc import ABC, abstractmethod
 
 from PIL import Image
@@ -43,6 +45,36 @@ class DisplayBase(ABC):
         """Put the display into low power mode."""
         pass
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _resize_plan(
+        src_width: int, src_height: int, disp_width: int, disp_height: int
+    ) -> tuple[int, int, int, int]:
+        """Compute the cover-resize geometry for a source/display size pair.
+
+        Cached because consecutive photos usually share dimensions (same phone),
+        so repeated calls skip the arithmetic entirely.
+
+        Args:
+            src_width: Source image width
+            src_height: Source image height
+            disp_width: Display width
+            disp_height: Display height
+
+        Returns:
+            Tuple of (new_width, new_height, left, top) where new_width and
+            new_height are the resize target covering the display, and
+            left/top the centered crop origin
+        """
+        # Use the larger scale factor so the image covers the entire display
+        scale = max(disp_width / src_width, disp_height / src_height)
+
+        new_width = int(src_width * scale)
+        new_height = int(src_height * scale)
+        left = (new_width - disp_width) // 2
+        top = (new_height - disp_height) // 2
+        return new_width, new_height, left, top
+
     def resize_image(self, image: Image.Image, maintain_aspect: bool = True) -> Image.Image:
         """Resize an image to cover the display.
 
@@ -53,25 +85,64 @@ class DisplayBase(ABC):
         Returns:
             Resized image that covers the entire display
         """
-        if maintain_aspect:
-            # Calculate scale factors to cover the display (not fit inside it)
-            scale_width = self.width / image.width
-            scale_height = self.height / image.height
-
-            # Use the larger scale factor so the image covers the entire display
-            scale = max(scale_width, scale_height)
+        # Already the right size: skip the resample and crop copies entirely
+        if image.size == (self.width, self.height):
+            return image
 
-            # Resize image to cover display
-            new_width = int(image.width * scale)
-            new_height = int(image.height * scale)
-            resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # reducing_gap enables Pillow's internal two-pass downscale (box
+        # prefilter, then LANCZOS on the small remainder) — same win as a
+        # manual Image.reduce pre-shrink, without the extra intermediate
+        if maintain_aspect:
+            new_width, new_height, left, top = self._resize_plan(
+                image.width, image.height, self.width, self.height
+            )
+
+            # Resize to cover the display, then crop to size (centered)
+            resized = image.resize(
+                (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0
+            )
+            return resized.crop((left, top, left + self.width, top + self.height))
+        else:
+            return image.resize(
+                (self.width, self.height), Image.Resampling.LANCZOS, reducing_gap=3.0
+            )
+
+    def make_preview(
+        self,
+        image: Image.Image,
+        width: int,
+        quality: int,
+        resample: Image.Resampling = Image.Resampling.BILINEAR,
+    ) -> bytes:
+        """Encode a small JPEG preview of an image.
+
+        Downscales in two passes (box prefilter via reducing_gap, then a
+        cheap finishing filter — bilinear by default), which is
+        indistinguishable from LANCZOS at thumbnail sizes but far cheaper,
+        and skips the JPEG optimize pass.
 
-            # Crop to display size (center the image)
-            left = (new_width - self.width) // 2
-            top = (new_height - self.height) // 2
-            right = left + self.width
-            bottom = top + self.height
+        Args:
+            image: Source image
+            width: Preview width in pixels (height maintains aspect ratio)
+            quality: JPEG quality (1-100)
+            resample: Resampling filter for the finishing pass
 
-            return resized.crop((left, top, right, bottom))
-        else:
-            return image.resize((self.width, self.height), Image.Resampling.LANCZOS)
+        Returns:
+            JPEG-encoded preview bytes
+        """
+        preview = image
+        if preview.mode == "RGBA":
+            # Flatten onto white like the display path, so the preview shows
+            # what the panel shows
+            background = Image.new("RGB", preview.size, (255, 255, 255))
+            background.paste(preview, mask=preview.getchannel("A"))
+            preview = background
+        elif preview.mode not in ("RGB", "L"):
+            preview = preview.convert("RGB")
+
+        target_height = max(1, round(preview.height * width / preview.width))
+        preview = preview.resize((width, target_height), resample, reducing_gap=3.0)
+
+        buffer = io.BytesIO()
+        preview.save(buffer, format="JPEG", quality=quality, optimize=False)
+        return buffer.getvalue()
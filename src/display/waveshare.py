@@ -1,14 +1,76 @@
 """Waveshare e-ink display implementation."""
 
+import functools
 import logging
 from typing import Protocol
 
+import numpy as np
 from PIL import Image
 
+from ._quantize import nearest_palette_indices
 from .base import DisplayBase
 
 logger = logging.getLogger(__name__)
 
+# Panel palettes for 7-color models, in driver index order. Models listed here
+# use the fast NumPy buffer conversion instead of the vendored driver's
+# per-pixel Python packing loop.
+_7COLOR_PALETTES = {
+    "7in3e": (
+        (0, 0, 0),
+        (255, 255, 255),
+        (255, 255, 0),
+        (255, 0, 0),
+        (0, 0, 0),
+        (0, 0, 255),
+        (0, 255, 0),
+    ),
+}
+
+
+@functools.cache
+def _palette_image(model: str) -> Image.Image:
+    """Build and cache the Pillow palette image for a 7-color model."""
+    flat = [channel for color in _7COLOR_PALETTES[model] for channel in color]
+    pal_image = Image.new("P", (1, 1))
+    pal_image.putpalette(flat + [0, 0, 0] * (256 - len(_7COLOR_PALETTES[model])))
+    return pal_image
+
+
+@functools.cache
+def _palette_array(model: str) -> np.ndarray:
+    """Build and cache the NumPy palette array for a 7-color model."""
+    return np.array(_7COLOR_PALETTES[model], dtype=np.int32)
+
+
+@functools.cache
+def _load_epd_class(model: str) -> type:
+    """Import and cache the EPD driver class for a display model.
+
+    Args:
+        model: Waveshare model name (e.g., "7in3e")
+
+    Returns:
+        The driver's EPD class
+
+    Raises:
+        ValueError: If the model is not supported
+    """
+    if model == "7in3e":
+        from src.vendor.waveshare_epd import epd7in3e
+
+        return epd7in3e.EPD
+    elif model == "7in5":
+        from src.vendor.waveshare_epd import epd7in5
+
+        return epd7in5.EPD
+    elif model == "7in5_V2":
+        from src.vendor.waveshare_epd import epd7in5_V2
+
+        return epd7in5_V2.EPD
+    else:
+        raise ValueError(f"Unsupported Waveshare model: {model}")
+
 
 class EPDProtocol(Protocol):
     """Protocol for Waveshare EPD display drivers."""
@@ -37,35 +99,29 @@ class EPDProtocol(Protocol):
 class WaveshareDisplay(DisplayBase):
     """Waveshare e-ink display implementation."""
 
-    def __init__(self, model: str = "7in3e", width: int = 800, height: int = 480):
+    def __init__(
+        self, model: str = "7in3e", width: int = 800, height: int = 480, dither: bool = True
+    ):
         """Initialize the Waveshare display.
 
         Args:
             model: Waveshare model (e.g., "7in3e" for 7.3inch e-Paper)
             width: Display width in pixels
             height: Display height in pixels
+            dither: Dither when quantizing to the panel palette; disabling it
+                trades output quality for a faster nearest-color conversion
         """
         super().__init__(width, height)
         self.model = model
+        self.dither = dither
         self.epd: EPDProtocol | None = None
+        # Assume unknown panel contents until the first explicit clear
+        self._panel_dirty = True
 
     def _get_epd_module(self) -> EPDProtocol:
         """Get the appropriate EPD module for the display model."""
         try:
-            if self.model == "7in3e":
-                from src.vendor.waveshare_epd import epd7in3e
-
-                return epd7in3e.EPD()
-            elif self.model == "7in5":
-                from src.vendor.waveshare_epd import epd7in5
-
-                return epd7in5.EPD()
-            elif self.model == "7in5_V2":
-                from src.vendor.waveshare_epd import epd7in5_V2
-
-                return epd7in5_V2.EPD()
-            else:
-                raise ValueError(f"Unsupported Waveshare model: {self.model}")
+            return _load_epd_class(self.model)()
         except ImportError as e:
             logger.error(f"Failed to import Waveshare EPD module: {e}")
             raise
@@ -76,6 +132,15 @@ class WaveshareDisplay(DisplayBase):
             logger.info(f"Initializing Waveshare {self.model} display")
             self.epd = self._get_epd_module()
             self.epd.init()
+
+            # Reused per-frame buffers so _getbuffer_fast is allocation-free:
+            # the packed frame lives in a bytearray with a NumPy view over it
+            self._frame_bytes = bytearray(self.height * self.width // 2)
+            self._frame_view = np.frombuffer(self._frame_bytes, dtype=np.uint8).reshape(
+                self.height, self.width // 2
+            )
+            self._idx_buf = np.empty((self.height, self.width), dtype=np.uint8)
+
             self.is_initialized = True
             logger.info("Display initialized successfully")
         except Exception as e:
@@ -92,8 +157,14 @@ class WaveshareDisplay(DisplayBase):
             raise RuntimeError("Display not initialized. Call init() first.")
 
         try:
-            # Ensure image is in the correct mode
-            if image.mode != "RGB":
+            # Ensure image is in the correct mode. RGBA is flattened onto
+            # white in one paste — convert("RGB") would just drop the alpha
+            # channel and show whatever RGB data hides under transparency
+            if image.mode == "RGBA":
+                background = Image.new("RGB", image.size, (255, 255, 255))
+                background.paste(image, mask=image.getchannel("A"))
+                image = background
+            elif image.mode != "RGB":
                 image = image.convert("RGB")
 
             # Resize image if necessary
@@ -103,21 +174,66 @@ class WaveshareDisplay(DisplayBase):
 
             # Display the image
             logger.info("Displaying image on e-ink display")
-            self.epd.display(self.epd.getbuffer(image))
+            if self.model in _7COLOR_PALETTES:
+                buf: list[int] | bytearray = self._getbuffer_fast(image)
+            else:
+                buf = self.epd.getbuffer(image)
+            self.epd.display(buf)
+            self._panel_dirty = True
             logger.info("Image displayed successfully")
 
         except Exception as e:
             logger.error(f"Failed to display image: {e}")
             raise
 
+    def _getbuffer_fast(self, image: Image.Image) -> bytearray:
+        """Convert an image to the packed 4-bit buffer for 7-color panels.
+
+        With dithering (the default) this is byte-for-byte equivalent to the
+        vendored driver's getbuffer, but the nibble packing runs as one
+        vectorized NumPy expression instead of a per-pixel Python loop (the
+        quantize itself already runs in C inside Pillow). With dithering
+        disabled, pixels are mapped straight to the nearest palette color via
+        the kernel in _quantize (numba-JITed when numba is installed).
+
+        Args:
+            image: PIL Image object sized for the panel
+
+        Returns:
+            Packed buffer with two palette indices per byte
+        """
+        if image.size == (self.height, self.width):
+            image = image.rotate(90, expand=True)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        if self.dither:
+            quantized = image.quantize(palette=_palette_image(self.model))
+            indices = np.frombuffer(quantized.tobytes("raw"), dtype=np.uint8).reshape(
+                self.height, self.width
+            )
+        else:
+            rgb = np.asarray(image, dtype=np.uint8)
+            indices = nearest_palette_indices(rgb, _palette_array(self.model), out=self._idx_buf)
+
+        # Pack two 4-bit indices per byte into the preallocated frame buffer
+        np.left_shift(indices[:, 0::2], 4, out=self._frame_view)
+        np.bitwise_or(self._frame_view, indices[:, 1::2], out=self._frame_view)
+        return self._frame_bytes
+
     def clear(self) -> None:
         """Clear the display."""
         if not self.is_initialized or self.epd is None:
             raise RuntimeError("Display not initialized. Call init() first.")
 
+        if not self._panel_dirty:
+            logger.debug("Panel already clear, skipping refresh")
+            return
+
         try:
             logger.info("Clearing display")
             self.epd.Clear()
+            self._panel_dirty = False
             logger.info("Display cleared")
         except Exception as e:
             logger.error(f"Failed to clear display: {e}")
@@ -1,8 +1,8 @@
 """Handler for displaying images from URLs."""
 
-import base64
-import io
 import logging
+import queue
+import threading
 from typing import TYPE_CHECKING, Any
 
 import requests
@@ -19,6 +19,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Maps the preview.resample config value to a Pillow filter
+_RESAMPLE_MODES = {
+    "bilinear": Image.Resampling.BILINEAR,
+    "bicubic": Image.Resampling.BICUBIC,
+    "lanczos": Image.Resampling.LANCZOS,
+}
+
 
 class ImageHandler(HandlerBase):
     """Handler for loading and displaying images from URLs."""
@@ -49,6 +56,27 @@ class ImageHandler(HandlerBase):
         self.preview_config = preview_config
         self.image_processing_config = image_processing_config
 
+        # One pooled session so repeat fetches from the same photo service
+        # reuse the TCP/TLS connection instead of re-handshaking per message
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Validators (ETag / Last-Modified) for the image currently on the
+        # panel, so re-requesting the same URL can return 304 and skip the
+        # decode/display path. Scoped to the last displayed URL only: a 304
+        # short-circuit is only safe when the panel already shows that URL
+        self._displayed: tuple[str, str | None, str | None] | None = None
+
+        # Preview encoding and publishing run on a worker thread so handle()
+        # returns as soon as the e-ink frame is latched
+        self._preview_queue: queue.Queue[Image.Image] = queue.Queue(maxsize=2)
+        self._preview_thread = threading.Thread(
+            target=self._preview_worker, name="preview-publisher", daemon=True
+        )
+        self._preview_thread.start()
+
     @property
     def supported_actions(self) -> list[str]:
         """List of supported action types."""
@@ -82,19 +110,44 @@ class ImageHandler(HandlerBase):
         clear_first = data.get("clear_first", False)
 
         try:
+            # Fetch image from URL. The request is made conditional only when
+            # this URL is the one already on the panel — then an unchanged
+            # image returns 304 and the panel is correctly left untouched
+            logger.info(f"Fetching image from: {url}")
+            headers = {"Accept-Encoding": "identity"}  # image bodies don't recompress
+            if self._displayed is not None and self._displayed[0] == url:
+                _, etag, last_modified = self._displayed
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+            response = self.session.get(url, timeout=self.timeout, stream=True, headers=headers)
+            if response.status_code == 304:
+                logger.info("Image unchanged since last display (304), skipping")
+                response.close()
+                return
+            response.raise_for_status()
+
             # Clear display if requested
             if clear_first:
                 logger.debug("Clearing display before showing new image")
                 self.display.clear()
 
-            # Fetch image from URL
-            logger.info(f"Fetching image from: {url}")
-            response = requests.get(url, timeout=self.timeout, stream=True)
-            response.raise_for_status()
+            # Load image straight from the response stream instead of
+            # materializing the whole body in a separate bytes object first
+            response.raw.decode_content = True
+            image = Image.open(response.raw)
+
+            # For oversized JPEGs, let libjpeg decode at a reduced DCT scale
+            # (1/2, 1/4, 1/8) instead of decoding every pixel just to shrink it
+            if image.format == "JPEG":
+                image.draft("RGB", (self.display.width * 2, self.display.height * 2))
+
+            # Force the decode while the connection is still open
+            image.load()
+            response.close()
 
-            # Load image
-            image_data = io.BytesIO(response.content)
-            image = Image.open(image_data)
             logger.info(f"Image loaded successfully: {image.size} {image.mode}")
 
             # Auto-crop borders if configured
@@ -109,6 +162,15 @@ class ImageHandler(HandlerBase):
             self.display.display_image(image)
             logger.info("Image displayed successfully")
 
+            # Remember what the panel now shows, with its validators, only
+            # after a successful display — a failed render is retried with a
+            # full fetch, and a different URL drops the previous validators
+            self._displayed = (
+                url,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+
             # Publish preview thumbnail if configured
             self._publish_preview(image)
 
@@ -123,7 +185,11 @@ class ImageHandler(HandlerBase):
             raise
 
     def _publish_preview(self, image: Image.Image) -> None:
-        """Generate and publish a preview thumbnail to MQTT.
+        """Queue a preview thumbnail for publishing on the worker thread.
+
+        The encode and publish run on the preview worker; the MQTT client's
+        background-task accounting keeps shutdown blocked until they finish.
+        A full queue drops the frame rather than blocking the handler.
 
         Args:
             image: The image to create a thumbnail from
@@ -135,40 +201,46 @@ class ImageHandler(HandlerBase):
             logger.warning("Preview enabled but no MQTT client available")
             return
 
+        self.mqtt_client.begin_background_task()
         try:
-            # Calculate thumbnail size maintaining aspect ratio
-            original_width, original_height = image.size
-            thumbnail_width = self.preview_config.width
-            thumbnail_height = int(original_height * (thumbnail_width / original_width))
-
-            # Create thumbnail
-            thumbnail = image.copy()
-            thumbnail.thumbnail((thumbnail_width, thumbnail_height), Image.Resampling.LANCZOS)
-
-            # Convert to JPEG bytes
-            buffer = io.BytesIO()
-            # Convert to RGB if necessary (e.g., RGBA images)
-            if thumbnail.mode in ("RGBA", "LA", "P"):
-                thumbnail = thumbnail.convert("RGB")
-            thumbnail.save(
-                buffer, format="JPEG", quality=self.preview_config.quality, optimize=True
-            )
-            jpeg_bytes = buffer.getvalue()
-
-            # Base64 encode
-            base64_image = base64.b64encode(jpeg_bytes)
-
-            # Publish to MQTT
-            self.mqtt_client.publish_binary(
-                topic=self.preview_config.topic,
-                payload=base64_image,
-                qos=1,
-                retain=True,
-            )
-            logger.info(
-                f"Published preview thumbnail ({thumbnail.width}x{thumbnail.height}, "
-                f"{len(base64_image)} bytes base64)"
-            )
+            self._preview_queue.put_nowait(image.copy())
+        except queue.Full:
+            self.mqtt_client.end_background_task()
+            logger.warning("Preview queue full, dropping preview frame")
+
+    def _preview_worker(self) -> None:
+        """Consume queued images, encode previews, and publish them."""
+        while True:
+            image = self._preview_queue.get()
+            try:
+                self._encode_and_publish_preview(image)
+            except Exception as e:
+                logger.error(f"Failed to publish preview thumbnail: {e}")
+            finally:
+                if self.mqtt_client:
+                    self.mqtt_client.end_background_task()
+                self._preview_queue.task_done()
+
+    def _encode_and_publish_preview(self, image: Image.Image) -> None:
+        """Generate and publish a preview thumbnail to MQTT.
 
-        except Exception as e:
-            logger.error(f"Failed to publish preview thumbnail: {e}")
+        Args:
+            image: The image to create a thumbnail from
+        """
+        assert self.preview_config is not None and self.mqtt_client is not None
+
+        # Encode thumbnail (resize + JPEG) via the shared display helper
+        resample = _RESAMPLE_MODES.get(self.preview_config.resample, Image.Resampling.BILINEAR)
+        jpeg_bytes = self.display.make_preview(
+            image, self.preview_config.width, self.preview_config.quality, resample
+        )
+
+        # Publish the JPEG bytes as-is; MQTT payloads are binary-safe, so
+        # base64 would only inflate the payload by a third
+        self.mqtt_client.publish_binary(
+            topic=self.preview_config.topic,
+            payload=jpeg_bytes,
+            qos=1,
+            retain=True,
+        )
+        logger.info(f"Published preview thumbnail ({len(jpeg_bytes)} bytes)")
@@ -4,15 +4,64 @@ import json
 import logging
 import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
 
 import paho.mqtt.client as mqtt
 from paho.mqtt.enums import CallbackAPIVersion
 
 from src.handlers.base import HandlerBase
 
+# orjson parses bytes directly and is several times faster than stdlib json;
+# fall back to json.loads (which also accepts bytes) when it isn't installed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSONDecodeError: type[Exception] = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 logger = logging.getLogger(__name__)
 
 
+class _LazyHandler(HandlerBase):
+    """Wrapper that defers handler construction until its first message.
+
+    Wakes that process no matching messages never pay for the wrapped
+    handler's imports and initialization.
+    """
+
+    def __init__(self, actions: list[str], factory: Callable[[], HandlerBase]):
+        """Initialize the lazy wrapper.
+
+        Args:
+            actions: Actions the wrapped handler supports
+            factory: Zero-argument callable that builds the real handler
+        """
+        super().__init__()
+        self._actions = actions
+        self._factory = factory
+        self._handler: HandlerBase | None = None
+
+    def can_handle(self, action: str) -> bool:
+        """Check if the wrapped handler can process the given action."""
+        return action in self._actions
+
+    def handle(self, data: dict[str, Any]) -> None:
+        """Materialize the wrapped handler on first use and delegate to it."""
+        if self._handler is None:
+            self._handler = self._factory()
+        self._handler.handle(data)
+
+    @property
+    def supported_actions(self) -> list[str]:
+        """List of supported action types."""
+        return self._actions
+
+
 class MQTTClient:
     """MQTT client for handling display commands."""
 
@@ -56,16 +105,25 @@ class MQTTClient:
         self.client.on_message = self._on_message
         self.client.on_disconnect = self._on_disconnect
 
-        # Message handlers registry
+        # Message handlers registry, plus an action -> handler map so message
+        # dispatch is a single dict lookup instead of a scan over can_handle()
         self.handlers: list[HandlerBase] = []
+        self._action_map: dict[str, HandlerBase] = {}
         self.topics: list[str] = []
         self.connected = threading.Event()
 
-        # Handler activity tracking for graceful shutdown
-        self._handler_lock = threading.Lock()
+        # Handler activity tracking for graceful shutdown: the condition is
+        # notified whenever the active count drops to zero, so shutdown waits
+        # exactly as long as work is in flight, with no polling
+        self._handler_cond = threading.Condition()
         self._active_handlers = 0
         self._shutting_down = False
 
+        # Handlers run on a single worker thread so the paho network loop
+        # returns immediately (keeping the broker keepalive alive during
+        # multi-second e-ink refreshes) while refreshes stay serialized
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="handler")
+
     def register_handler(self, handler: HandlerBase) -> None:
         """Register a message handler.
 
@@ -73,8 +131,29 @@ class MQTTClient:
             handler: Handler instance to register
         """
         self.handlers.append(handler)
+        for action in handler.supported_actions:
+            self._action_map[action] = handler
         logger.info(f"Registered handler for actions: {handler.supported_actions}")
 
+    def register_handler_factory(
+        self, actions: list[str], factory: Callable[[], HandlerBase]
+    ) -> None:
+        """Register a handler lazily via a factory.
+
+        The factory is invoked on the first message matching one of the given
+        actions, so handlers with heavy dependencies are never constructed on
+        wakes that don't need them.
+
+        Args:
+            actions: Actions the handler will support
+            factory: Zero-argument callable that builds the handler
+        """
+        lazy = _LazyHandler(actions, factory)
+        self.handlers.append(lazy)
+        for action in actions:
+            self._action_map[action] = lazy
+        logger.info(f"Registered lazy handler for actions: {actions}")
+
     def add_topic(self, topic: str) -> None:
         """Add a topic to subscribe to.
 
@@ -90,7 +169,7 @@ class MQTTClient:
             logger.info(f"Connecting to MQTT broker {self.broker_host}:{self.broker_port}")
 
             # Reset shutdown flag to allow message processing after reconnect
-            with self._handler_lock:
+            with self._handler_cond:
                 self._shutting_down = False
 
             self.client.connect(self.broker_host, self.broker_port, keepalive=60)
@@ -106,6 +185,14 @@ class MQTTClient:
             logger.error(f"Failed to connect to MQTT broker: {e}")
             raise
 
+    def is_connected(self) -> bool:
+        """Check whether the client is currently connected to the broker.
+
+        Returns:
+            True if connected
+        """
+        return self.connected.is_set() and self.client.is_connected()
+
     def publish(self, topic: str, payload: dict, qos: int = 1, retain: bool = False) -> None:
         """Publish a message to a topic.
 
@@ -141,8 +228,47 @@ class MQTTClient:
         except Exception as e:
             logger.error(f"Failed to publish binary data to {topic}: {e}")
 
+    def begin_background_task(self) -> None:
+        """Count a background task toward graceful-shutdown waiting.
+
+        Handlers that hand work off to their own threads (e.g. preview
+        publishing) call this when queueing, so wait_for_handlers() keeps
+        blocking shutdown until the work is flushed.
+        """
+        with self._handler_cond:
+            self._active_handlers += 1
+
+    def end_background_task(self) -> None:
+        """Mark a background task as finished."""
+        with self._handler_cond:
+            self._active_handlers -= 1
+            if self._active_handlers == 0:
+                self._handler_cond.notify_all()
+
+    def _run_handler(self, handler: HandlerBase, data: dict[str, Any]) -> None:
+        """Execute a handler on the worker thread, logging failures.
+
+        Args:
+            handler: Handler to run
+            data: Message data to pass to the handler
+        """
+        try:
+            handler.handle(data)
+        except Exception as e:
+            logger.error(f"Handler failed to process message: {e}")
+
+    def _handler_finished(self, future: Future) -> None:
+        """Done-callback for dispatched handlers; updates shutdown accounting."""
+        with self._handler_cond:
+            self._active_handlers -= 1
+            if self._active_handlers == 0:
+                self._handler_cond.notify_all()
+
     def wait_for_handlers(self, timeout: float = 60.0) -> bool:
-        """Wait for all active handlers to complete.
+        """Wait for all active handlers and background tasks to complete.
+
+        Blocks on the handler condition, so the wait wakes the instant the
+        last piece of work finishes instead of sleep-polling.
 
         Args:
             timeout: Maximum time to wait in seconds
@@ -150,31 +276,25 @@ class MQTTClient:
         Returns:
             True if all handlers completed, False if timeout occurred
         """
-        start_time = time.time()
-        while True:
-            with self._handler_lock:
-                if self._active_handlers == 0:
-                    logger.info("All handlers completed")
-                    return True
-
-                active_count = self._active_handlers
-
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                logger.warning(
-                    f"Timeout waiting for {active_count} handler(s) to complete after {timeout}s"
-                )
-                return False
-
-            logger.debug(f"Waiting for {active_count} handler(s) to complete...")
-            time.sleep(0.1)
+        with self._handler_cond:
+            completed = self._handler_cond.wait_for(
+                lambda: self._active_handlers == 0, timeout=timeout
+            )
+            if completed:
+                logger.info("All handlers completed")
+                return True
+            logger.warning(
+                f"Timeout waiting for {self._active_handlers} handler(s) "
+                f"to complete after {timeout}s"
+            )
+            return False
 
     def disconnect(self) -> None:
         """Disconnect from the MQTT broker."""
         logger.info("Disconnecting from MQTT broker")
 
         # Mark as shutting down to prevent new messages from being processed
-        with self._handler_lock:
+        with self._handler_cond:
             self._shutting_down = True
 
         # Wait for active handlers to complete
@@ -239,19 +359,22 @@ class MQTTClient:
         """
         try:
             # Check if we're shutting down
-            with self._handler_lock:
+            with self._handler_cond:
                 if self._shutting_down:
                     logger.debug("Ignoring message - shutting down")
                     return
 
             topic = msg.topic
-            payload = msg.payload.decode("utf-8")
-            logger.debug(f"Received message on {topic}: {payload}")
+            # Only pay for the payload decode when debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Received message on {topic}: {msg.payload.decode('utf-8', 'replace')}"
+                )
 
-            # Parse JSON payload
+            # Parse JSON straight from the payload bytes (no decode copy)
             try:
-                message = json.loads(payload)
-            except json.JSONDecodeError as e:
+                message = _json_loads(msg.payload)
+            except _JSONDecodeError as e:
                 logger.error(f"Invalid JSON in message: {e}")
                 return
 
@@ -263,32 +386,22 @@ class MQTTClient:
                 logger.error("Message missing 'action' field")
                 return
 
-            # Find and execute appropriate handler
-            handler_found = False
-            for handler in self.handlers:
-                if handler.can_handle(action):
-                    logger.info(f"Processing '{action}' with {handler.__class__.__name__}")
-                    try:
-                        # Track handler activity
-                        with self._handler_lock:
-                            if self._shutting_down:
-                                logger.info("Shutdown initiated - not processing new message")
-                                return
-                            self._active_handlers += 1
-
-                        try:
-                            handler.handle(data)
-                        finally:
-                            with self._handler_lock:
-                                self._active_handlers -= 1
-
-                        handler_found = True
-                        break
-                    except Exception as e:
-                        logger.error(f"Handler failed to process message: {e}")
-
-            if not handler_found:
+            # Look up the handler and dispatch to the worker thread
+            handler = self._action_map.get(action)
+            if handler is None:
                 logger.warning(f"No handler found for action: {action}")
+                return
+
+            logger.info(f"Processing '{action}' with {handler.__class__.__name__}")
+
+            # Track handler activity
+            with self._handler_cond:
+                if self._shutting_down:
+                    logger.info("Shutdown initiated - not processing new message")
+                    return
+                self._active_handlers += 1
+                future = self._executor.submit(self._run_handler, handler, data)
+            future.add_done_callback(self._handler_finished)
 
         except Exception as e:
             logger.error(f"Error processing message: {e}")
@@ -1,12 +1,28 @@
 """Pisugar client for RTC alarm and power management."""
 
 import logging
+import os
 import re
 import socket
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Default pisugar-server Unix socket; preferred over loopback TCP when usable
+DEFAULT_SOCKET_PATH = "/tmp/pisugar-server.sock"
+
+# Timezone offset as it appears in RTC time responses (e.g. "+11:00"),
+# compiled once; only consulted when the fixed-position slice doesn't match
+_TZ_RE = re.compile(r"([+-]\d{2}:\d{2})")
+
+# Read-only commands whose responses may be served from a short-lived cache;
+# any other (state-changing) command invalidates it
+_READONLY_COMMANDS = frozenset(
+    {"get battery", "get rtc_time", "get rtc_alarm_time", "get rtc_alarm_enabled"}
+)
+_RESPONSE_CACHE_TTL = 0.5  # seconds
+
 
 class PisugarClient:
     """Client for communicating with Pisugar power manager via Unix socket or TCP."""
@@ -20,68 +36,158 @@ class PisugarClient:
         """Initialize Pisugar client.
 
         Args:
-            socket_path: Path to Pisugar Unix domain socket (if None, uses TCP)
+            socket_path: Path to Pisugar Unix domain socket (if None, the
+                default socket is used when accessible, falling back to TCP)
             host: TCP host (default: 127.0.0.1, only used if socket_path is None)
             port: TCP port (default: 8423, only used if socket_path is None)
         """
+        if socket_path is None and os.access(DEFAULT_SOCKET_PATH, os.R_OK | os.W_OK):
+            # A local Unix socket round-trip is several times cheaper than
+            # loopback TCP; adopt it when the server socket is reachable.
+            # The access check keeps the documented permission-issue cases
+            # on TCP, where they work today.
+            logger.debug(f"Using Pisugar Unix socket at {DEFAULT_SOCKET_PATH}")
+            socket_path = DEFAULT_SOCKET_PATH
+
         self.socket_path = socket_path
         self.host = host
         self.port = port
         self.use_tcp = socket_path is None
-
-    def _send_command(self, command: str) -> str:
-        """Send command to Pisugar and return response.
+        # Pooled connection, opened lazily and reused across commands so
+        # multi-command operations pay connection setup once
+        self._sock: socket.socket | None = None
+        # RTC timezone offset, discovered once — it only changes on DST or
+        # reconfiguration (see invalidate_timezone_cache)
+        self._cached_tz: str | None = None
+        # Recent responses to read-only commands, command -> (timestamp, response)
+        self._resp_cache: dict[str, tuple[float, str]] = {}
+
+    def _connect(self) -> socket.socket:
+        """Open a new socket to pisugar-server (Unix domain or TCP)."""
+        if self.use_tcp:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(5.0)  # 5 second timeout
+            # Commands and responses are tiny single packets, the worst case
+            # for Nagle's algorithm (up to 40 ms of coalescing delay) — send
+            # immediately instead. Small buffers suffice for this traffic.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+            sock.connect((self.host, self.port))
+            logger.debug(f"Connected to Pisugar via TCP {self.host}:{self.port}")
+        else:
+            if self.socket_path is None:
+                raise ValueError("socket_path must be provided when use_tcp is False")
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(5.0)  # 5 second timeout
+            sock.connect(self.socket_path)
+            logger.debug(f"Connected to Pisugar via Unix socket {self.socket_path}")
+        return sock
+
+    def _get_sock(self) -> socket.socket:
+        """Return the pooled socket, connecting on first use."""
+        if self._sock is None:
+            self._sock = self._connect()
+        return self._sock
+
+    def close(self) -> None:
+        """Close the pooled socket; the next command reconnects lazily."""
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+    def __enter__(self) -> "PisugarClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _exchange(self, commands: list[str]) -> list[str]:
+        """Send one or more commands pipelined and read their responses.
+
+        All commands go out in a single write over the pooled connection;
+        responses are newline-framed "<key>: <value>" lines whose key echoes
+        the command, so each is read until its answering line arrives —
+        skipping interleaved notifications (e.g. button events) — instead of
+        the old drain-until-timeout read (a flat 1 s stall per command). If
+        the server dropped the pooled connection, one reconnect is attempted.
 
         Args:
-            command: Command to send
+            commands: Commands to send, in order
 
         Returns:
-            Response string from Pisugar
+            Response line for each command, in the same order
 
         Raises:
             ConnectionError: If connection to Pisugar fails
-            TimeoutError: If command times out
+            TimeoutError: If a response times out
         """
+        # Keywords are matched as bytes so skipped notification lines are
+        # never decoded; only the line answering each command is
+        keywords = []
+        for command in commands:
+            parts = command.split()
+            keywords.append(((parts[1] if parts[0] == "get" else parts[0]) + ":").encode())
+        payload = "".join(f"{command}\n" for command in commands).encode()
+
         try:
-            # Create socket (Unix domain or TCP)
-            if self.use_tcp:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5.0)  # 5 second timeout
-                sock.connect((self.host, self.port))
-                logger.debug(
-                    f"Sending command to Pisugar via TCP {self.host}:{self.port}: {command}"
-                )
-            else:
-                if self.socket_path is None:
-                    raise ValueError("socket_path must be provided when use_tcp is False")
-                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                sock.settimeout(5.0)  # 5 second timeout
-                sock.connect(self.socket_path)
-                logger.debug(
-                    f"Sending command to Pisugar via Unix socket {self.socket_path}: {command}"
-                )
-
-            # Send command (must end with newline)
-            sock.sendall(f"{command}\n".encode())
-
-            # Receive response (read all available data)
-            sock.settimeout(1.0)  # 1 second timeout for reading
-            response_parts = []
-            while True:
+            for attempt in range(2):
+                reused = self._sock is not None
+                sock = self._get_sock()
                 try:
-                    chunk = sock.recv(1024).decode("utf-8")
-                    if not chunk:
-                        break
-                    response_parts.append(chunk)
-                except TimeoutError:
-                    # No more data available
-                    break
-
-            response = "".join(response_parts).strip()
-            logger.debug(f"Pisugar response: {response}")
-
-            sock.close()
-            return response
+                    logger.debug(f"Sending command(s) to Pisugar: {commands}")
+                    sock.settimeout(5.0)
+                    sock.sendall(payload)
+
+                    responses: list[str] = []
+                    buffer = b""
+                    closed = False
+                    for keyword in keywords:
+                        response: str | None = None
+                        while response is None and not closed:
+                            if b"\n" not in buffer:
+                                chunk = sock.recv(1024)
+                                if not chunk:
+                                    # Peer closed the connection; drop it
+                                    # from the pool
+                                    self.close()
+                                    closed = True
+                                    break
+                                buffer += chunk
+                                continue
+                            line, _, buffer = buffer.partition(b"\n")
+                            if keyword in line:
+                                response = line.decode("utf-8").strip()
+                        if response is None:
+                            break
+                        responses.append(response)
+
+                    if len(responses) != len(commands):
+                        if reused:
+                            # An idle pooled connection the server has since
+                            # closed reads as empty; retry on a fresh socket
+                            logger.debug("No response on pooled connection, retrying")
+                            self.close()
+                            continue
+                        # Surface whatever arrived (empty for the unanswered
+                        # tail) rather than failing the whole exchange
+                        leftover = buffer.decode("utf-8").strip()
+                        responses.append(leftover)
+                        responses.extend([""] * (len(commands) - len(responses)))
+                    logger.debug(f"Pisugar response(s): {responses}")
+                    return responses
+
+                except (BrokenPipeError, ConnectionResetError):
+                    # Stale pooled connection (e.g. pisugar-server restarted)
+                    logger.debug("Pooled Pisugar connection went stale, reconnecting")
+                    self.close()
+                    if attempt == 1:
+                        raise
+
+            raise ConnectionError("Failed to communicate with Pisugar")  # unreachable
 
         except FileNotFoundError as e:
             raise ConnectionError(
@@ -97,10 +203,75 @@ class PisugarClient:
                 "Connection refused to Pisugar socket. Is pisugar-server running?"
             ) from e
         except TimeoutError as e:
-            raise TimeoutError(f"Timeout waiting for Pisugar response to: {command}") from e
+            # The response may still arrive after we gave up; drop the pooled
+            # socket so a later command can't read the stale line as its own
+            self.close()
+            raise TimeoutError(
+                f"Timeout waiting for Pisugar response to: {', '.join(commands)}"
+            ) from e
         except Exception as e:
             raise ConnectionError(f"Failed to communicate with Pisugar: {e}") from e
 
+    def _send_command(self, command: str) -> str:
+        """Send command to Pisugar and return response.
+
+        Args:
+            command: Command to send
+
+        Returns:
+            Response string from Pisugar
+
+        Raises:
+            ConnectionError: If connection to Pisugar fails
+            TimeoutError: If command times out
+        """
+        # Read-only getters are often queried back-to-back (e.g. verifying an
+        # alarm right after reading battery state); within a short TTL the
+        # previous response is still accurate, so skip the round-trip.
+        # State-changing commands invalidate everything cached.
+        cacheable = command in _READONLY_COMMANDS
+        if cacheable:
+            cached = self._resp_cache.get(command)
+            if cached is not None and time.monotonic() - cached[0] < _RESPONSE_CACHE_TTL:
+                logger.debug(f"Pisugar response (cached): {cached[1]}")
+                return cached[1]
+        else:
+            self._resp_cache.clear()
+
+        response = self._exchange([command])[0]
+        if cacheable:
+            self._resp_cache[command] = (time.monotonic(), response)
+        return response
+
+    def send_batch(self, commands: list[str]) -> list[str]:
+        """Send several commands in one pipelined exchange.
+
+        The whole batch is written in a single send and the responses are
+        framed off the stream in order, so N commands cost one round-trip
+        instead of N.
+
+        Args:
+            commands: Commands to send, in order
+
+        Returns:
+            Response string for each command, in the same order
+
+        Raises:
+            ConnectionError: If connection to Pisugar fails
+            TimeoutError: If a response times out
+        """
+        if not commands:
+            return []
+        if any(command not in _READONLY_COMMANDS for command in commands):
+            self._resp_cache.clear()
+
+        responses = self._exchange(commands)
+        now = time.monotonic()
+        for command, response in zip(commands, responses, strict=True):
+            if command in _READONLY_COMMANDS:
+                self._resp_cache[command] = (now, response)
+        return responses
+
     def set_rtc_alarm(self, wake_time: datetime, repeat: int = 127) -> None:
         """Set RTC alarm for wake-up.
 
@@ -116,12 +287,21 @@ class PisugarClient:
             trigger at the specified time according to the repeat pattern (weekdays).
             The timezone must match the RTC's timezone.
         """
-        # Get RTC timezone to match its format
-        rtc_response = self._send_command("get rtc_time")
-        # Extract timezone offset using regex
-        # (e.g., "+11:00" from "rtc_time: 2025-10-06T12:08:51.000+11:00")
-        match = re.search(r"([+-]\d{2}:\d{2})", rtc_response)
-        timezone_offset = match.group(1) if match else "+00:00"
+        # Get RTC timezone to match its format; the offset is effectively
+        # constant per device, so one discovery round-trip serves all
+        # subsequent alarm sets
+        if self._cached_tz is None:
+            rtc_response = self._send_command("get rtc_time")
+            # The offset sits at a fixed position at the end of the response
+            # (e.g., "+11:00" from "rtc_time: 2025-10-06T12:08:51.000+11:00"),
+            # so a slice check covers the normal case without the regex engine
+            tz = rtc_response[-6:]
+            if len(tz) == 6 and tz[0] in "+-" and tz[3] == ":":
+                self._cached_tz = tz
+            else:
+                match = _TZ_RE.search(rtc_response)
+                self._cached_tz = match.group(1) if match else "+00:00"
+        timezone_offset = self._cached_tz
 
         # Format time with timezone (date will be stored but only time-of-day is used for alarm)
         iso_time = wake_time.strftime(f"%Y-%m-%dT%H:%M:%S{timezone_offset}")
@@ -135,6 +315,14 @@ class PisugarClient:
         # Log response at debug level - actual verification happens via is_rtc_alarm_enabled()
         logger.debug(f"RTC alarm set response: {response}")
 
+    def invalidate_timezone_cache(self) -> None:
+        """Forget the cached RTC timezone offset.
+
+        Call after a DST transition or timezone reconfiguration so the next
+        set_rtc_alarm() re-discovers the offset from the RTC.
+        """
+        self._cached_tz = None
+
     def disable_rtc_alarm(self) -> None:
         """Disable RTC alarm.
 
@@ -185,14 +373,11 @@ class PisugarClient:
         """
         try:
             response = self._send_command("get battery")
-            # Response format: "single\nbattery: 98.37336" (multi-line)
-            # Look for line containing "battery:"
-            for line in response.split("\n"):
-                if "battery:" in line.lower():
-                    parts = line.split(":")
-                    if len(parts) >= 2:
-                        battery_str = parts[1].strip().rstrip("%")
-                        return float(battery_str)
+            # Framing already isolates the "battery: 98.37336" line, so one
+            # partition replaces the old split-into-lines scan
+            _, sep, value = response.partition("battery:")
+            if sep:
+                return float(value.strip().rstrip("%"))
             logger.warning(f"Unexpected battery response: {response}")
             return None
         except Exception as e:
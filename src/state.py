@@ -15,8 +15,10 @@ class AppState:
 
     def __init__(self):
         """Initialize application state."""
-        self._continuous_mode = False
-        self._lock = threading.Lock()
+        # An Event models the monotonic False -> True flag directly:
+        # is_set()/set() are safe without an explicit lock, and wait()
+        # is available should anything want to block on the transition
+        self._continuous_mode = threading.Event()
 
     def enter_continuous_mode(self) -> None:
         """Switch from battery mode to continuous mode.
@@ -25,10 +27,9 @@ class AppState:
         processing messages and will instead run indefinitely until
         manually stopped.
         """
-        with self._lock:
-            if not self._continuous_mode:
-                logger.info("Entering continuous mode - shutdown canceled")
-                self._continuous_mode = True
+        if not self._continuous_mode.is_set():
+            logger.info("Entering continuous mode - shutdown canceled")
+            self._continuous_mode.set()
 
     def is_continuous_mode(self) -> bool:
         """Check if application is in continuous mode.
@@ -36,5 +37,4 @@ class AppState:
         Returns:
             True if in continuous mode, False otherwise
         """
-        with self._lock:
-            return self._continuous_mode
+        return self._continuous_mode.is_set()
@@ -5,11 +5,147 @@ import logging
 import numpy as np
 from PIL import Image
 
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
 # Border detection constants
 UNIFORMITY_THRESHOLD = 25.0  # Max std deviation for uniform borders (higher = more permissive)
 MIN_BORDER_SIZE = 5  # Minimum border size in pixels to warrant cropping
+MAX_BORDER_SCAN = 256  # Lines examined from each edge before falling back to the full axis
+DOWNSAMPLE_LIMIT = 1024  # Detect on a strided subsample above this dimension
+
+
+def _line_nonuniform(img_array: np.ndarray, axis: int) -> np.ndarray:
+    """Mask of lines whose variance exceeds the uniformity threshold.
+
+    std > thr is tested as n·Σx² − (Σx)² > n²·thr² on integer sum and
+    sum-of-squares accumulators, sparing np.std's float64 upcast of the
+    pixel data and its per-line sqrt — the threshold test doesn't need them.
+
+    Args:
+        img_array: Image array, (H, W, C) or (H, W)
+        axis: 0 for per-row values, 1 for per-column values
+
+    Returns:
+        Boolean array, True where a line is non-uniform
+    """
+    if img_array.ndim == 3:
+        spec = "ijk,ijk->i" if axis == 0 else "ijk,ijk->j"
+        n = img_array.shape[1 - axis] * img_array.shape[2]
+        reduce_axes: int | tuple[int, int] = (1, 2) if axis == 0 else (0, 2)
+    else:
+        spec = "ij,ij->i" if axis == 0 else "ij,ij->j"
+        n = img_array.shape[1 - axis]
+        reduce_axes = 1 - axis
+
+    line_sum = img_array.sum(axis=reduce_axes, dtype=np.int64)
+    line_sumsq = np.einsum(spec, img_array, img_array, dtype=np.int64)
+    return n * line_sumsq - line_sum * line_sum > UNIFORMITY_THRESHOLD**2 * n * n
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def _first_nonuniform_line(img, thr_sq):  # pragma: no cover - needs numba
+        """Index of the first line (axis 0) whose variance exceeds thr_sq, or -1.
+
+        Fuses the sum/sum-of-squares accumulation with the threshold test and
+        stops at the first hit, so a thin border costs a few lines of reads
+        instead of the whole window. Scan other edges/axes by passing flipped
+        or transposed views.
+        """
+        n = img.shape[1] * img.shape[2]
+        for y in range(img.shape[0]):
+            s = np.int64(0)
+            ss = np.int64(0)
+            for x in range(img.shape[1]):
+                for k in range(img.shape[2]):
+                    v = np.int64(img[y, x, k])
+                    s += v
+                    ss += v * v
+            if n * ss - s * s > thr_sq * n * n:
+                return y
+        return -1
+
+
+def _scan_edge(img_array: np.ndarray, axis: int, front: bool) -> int:
+    """Find the uniform-border depth from one edge of an image.
+
+    Only the first MAX_BORDER_SCAN lines from the edge are examined — borders
+    are typically a few dozen pixels, so this avoids reading the whole image.
+    If that entire window is uniform, the scan falls back to the full axis.
+
+    Args:
+        img_array: Image array, (H, W, C) or (H, W)
+        axis: 0 to scan rows, 1 to scan columns
+        front: True for the top/left edge, False for the bottom/right edge
+
+    Returns:
+        Number of uniform lines at that edge (0 for none, or for a fully
+        uniform axis, which keeps the full extent like the original scans)
+    """
+    length = img_array.shape[axis]
+    window = min(MAX_BORDER_SCAN, length)
+
+    index: list[slice] = [slice(None)] * img_array.ndim
+    index[axis] = slice(0, window) if front else slice(length - window, length)
+
+    for sub in (img_array[tuple(index)], img_array):
+        if HAVE_NUMBA:
+            # The JIT kernel scans lines lazily with per-line early exit, so
+            # it reads only as deep as the border actually goes; the scanned
+            # edge is reoriented to the front of axis 0 via views
+            view = sub if sub.ndim == 3 else sub[:, :, np.newaxis]
+            if axis == 1:
+                view = view.transpose(1, 0, 2)
+            if not front:
+                view = view[::-1]
+            depth = int(_first_nonuniform_line(view, UNIFORMITY_THRESHOLD**2))
+            if depth >= 0:
+                return depth
+        else:
+            mask = _line_nonuniform(sub, axis)
+            if not front:
+                mask = mask[::-1]
+            if mask.any():
+                return int(np.argmax(mask))
+        if window == length:
+            break
+    return 0
+
+
+def _refine_edge(img_array: np.ndarray, axis: int, depth: int, stride: int) -> int:
+    """Pin down an edge depth estimated on a strided subsample.
+
+    The exact boundary lies within a stride of the estimate, so only that
+    slab of full-resolution lines is re-examined.
+
+    Args:
+        img_array: Full-resolution image array, oriented so the scanned edge
+            comes first (flip the array for bottom/right edges)
+        axis: 0 for rows, 1 for columns
+        depth: Approximate uniform depth in full-resolution coordinates
+        stride: Subsample stride the estimate was computed with
+
+    Returns:
+        Exact uniform-border depth from the edge
+    """
+    length = img_array.shape[axis]
+    lo = max(0, depth - stride + 1)
+    hi = min(length, depth + stride)
+
+    index: list[slice] = [slice(None)] * img_array.ndim
+    index[axis] = slice(lo, hi)
+    mask = _line_nonuniform(img_array[tuple(index)], axis)
+    if mask.any():
+        return lo + int(np.argmax(mask))
+    return depth
 
 
 def auto_crop_borders(image: Image.Image) -> Image.Image:
@@ -34,66 +170,65 @@ def auto_crop_borders(image: Image.Image) -> Image.Image:
     else:
         image_rgb = image
 
-    # Convert to numpy array for efficient processing
-    img_array = np.array(image_rgb)
+    # Read-only view of the pixel data — detection never writes, so asarray
+    # avoids np.array's full copy (tens of MB for multi-megapixel photos)
+    img_array = np.asarray(image_rgb)
     height, width = img_array.shape[:2]
 
+    # Most photos have no border at all. Sample each edge line at its corners
+    # and midpoint: a uniform edge line keeps its samples close together, so
+    # when every edge's samples already spread far beyond the threshold, no
+    # edge can start with a uniform line and all four scans would return 0.
+    # Skip them entirely in that case; an edge that looks possibly uniform
+    # falls through to the real scan.
+    edge_samples = (
+        img_array[0, [0, width // 2, width - 1]],
+        img_array[height - 1, [0, width // 2, width - 1]],
+        img_array[[0, height // 2, height - 1], 0],
+        img_array[[0, height // 2, height - 1], width - 1],
+    )
+    if all(
+        int(np.ptp(edge.astype(np.int16), axis=0).max()) > 4 * UNIFORMITY_THRESHOLD
+        for edge in edge_samples
+    ):
+        logger.debug("Edge samples non-uniform on every side, skipping border scan")
+        return image
+
     logger.debug(
         f"Analyzing image ({width}x{height}) for uniform borders "
         f"(uniformity_threshold={UNIFORMITY_THRESHOLD}, min_border_size={MIN_BORDER_SIZE})"
     )
 
-    # Determine if a row/column is "uniform" (solid color) based on variance
-    def is_border_line(line: np.ndarray) -> bool:
-        """Check if a line (row or column) is uniform (low variance/contrast).
-
-        This detects borders of ANY solid color by measuring pixel variance.
-        Low variance = uniform/solid color = likely a border.
-
-        Args:
-            line: numpy array representing a row or column
+    # Large images are detected on a strided subsample (the std threshold is
+    # tolerant enough that sampling barely moves it), then the exact boundary
+    # is recovered from full-resolution lines around the estimate. Sampling
+    # must be point sampling, not a box downsample like Image.reduce:
+    # averaging divides the per-line std of detailed content by the stride,
+    # dropping real image lines below UNIFORMITY_THRESHOLD and misreading
+    # them as border
+    stride = 1
+    detect_array = img_array
+    if max(height, width) > DOWNSAMPLE_LIMIT:
+        stride = 4 if max(height, width) > 2 * DOWNSAMPLE_LIMIT else 2
+        detect_array = img_array[::stride, ::stride]
 
-        Returns:
-            True if the line has low enough variance to be considered uniform
-        """
-        if len(line.shape) == 3:  # RGB image
-            # Calculate standard deviation across all RGB channels
-            # Flatten to (pixels * channels) and compute std
-            std_dev = np.std(line)
-        else:  # Grayscale
-            std_dev = np.std(line)
-
-        return bool(std_dev <= UNIFORMITY_THRESHOLD)
-
-    # Find borders from each edge
-    top_border = 0
-    bottom_border = height
-    left_border = 0
-    right_border = width
-
-    # Scan from top
-    for i in range(height):
-        if not is_border_line(img_array[i, :]):
-            top_border = i
-            break
-
-    # Scan from bottom
-    for i in range(height - 1, -1, -1):
-        if not is_border_line(img_array[i, :]):
-            bottom_border = i + 1
-            break
+    # Uniform-border depth from each edge, scanning a capped window of lines
+    # (vectorized std reductions; a line is a border when its std is low)
+    top_depth = _scan_edge(detect_array, axis=0, front=True)
+    bottom_depth = _scan_edge(detect_array, axis=0, front=False)
+    left_depth = _scan_edge(detect_array, axis=1, front=True)
+    right_depth = _scan_edge(detect_array, axis=1, front=False)
 
-    # Scan from left
-    for i in range(width):
-        if not is_border_line(img_array[:, i]):
-            left_border = i
-            break
+    if stride > 1:
+        top_depth = _refine_edge(img_array, 0, top_depth * stride, stride)
+        bottom_depth = _refine_edge(np.flip(img_array, 0), 0, bottom_depth * stride, stride)
+        left_depth = _refine_edge(img_array, 1, left_depth * stride, stride)
+        right_depth = _refine_edge(np.flip(img_array, 1), 1, right_depth * stride, stride)
 
-    # Scan from right
-    for i in range(width - 1, -1, -1):
-        if not is_border_line(img_array[:, i]):
-            right_border = i + 1
-            break
+    top_border = top_depth
+    bottom_border = height - bottom_depth
+    left_border = left_depth
+    right_border = width - right_depth
 
     # Calculate detected border sizes
     border_sizes = {